@@ -6,6 +6,8 @@
 from ctypes import *
 from ctypes.util import find_library
 from enum import IntEnum, IntFlag
+from typing import Any
+import functools
 import os
 import platform
 
@@ -38,6 +40,9 @@ class AbsCellMode(IntEnum):
     CV = 0
     ILIM = 1
 
+# Reading a c_char array field of a Structure already returns bytes only up to
+# the first NUL, so the string accessors below decode the fields directly.
+
 class AbsDeviceInfo(Structure):
     """Basic information about an ABS."""
 
@@ -123,6 +128,234 @@ class ScpiClientError(Exception):
     """SCPI client returned an error."""
     pass
 
+# Prototypes of the native library functions, as (name, restype, argtypes).
+# These are applied once when the library is loaded so that ctypes doesn't have
+# to guess at argument conversions on every call.
+_DLL_FUNCTIONS = [
+    ("AbsScpiClient_ErrorMessage", c_char_p, [c_int]),
+    ("AbsScpiClient_Init", c_int, [POINTER(c_void_p)]),
+    ("AbsScpiClient_Destroy", None, [POINTER(c_void_p)]),
+    ("AbsScpiClient_OpenUdp", c_int, [c_void_p, c_char_p, c_char_p]),
+    ("AbsScpiClient_OpenTcp", c_int, [c_void_p, c_char_p]),
+    ("AbsScpiClient_OpenSerial", c_int, [c_void_p, c_char_p, c_uint]),
+    ("AbsScpiClient_OpenUdpMulticast", c_int, [c_void_p, c_char_p]),
+    ("AbsScpiClient_Close", c_int, [c_void_p]),
+    ("AbsScpiClient_SetTargetDeviceId", c_int, [c_void_p, c_uint]),
+    ("AbsScpiClient_GetTargetDeviceId", c_int, [c_void_p, POINTER(c_uint)]),
+    ("AbsScpiClient_GetDeviceInfo", c_int,
+     [c_void_p, POINTER(AbsDeviceInfo)]),
+    ("AbsScpiClient_GetDeviceId", c_int, [c_void_p, POINTER(c_uint8)]),
+    ("AbsScpiClient_GetIPAddress", c_int,
+     [c_void_p, POINTER(AbsEthernetConfig)]),
+    ("AbsScpiClient_SetIPAddress", c_int,
+     [c_void_p, POINTER(AbsEthernetConfig)]),
+    ("AbsScpiClient_GetCalibrationDate", c_int,
+     [c_void_p, POINTER(c_char), c_uint]),
+    ("AbsScpiClient_GetErrorCount", c_int, [c_void_p, POINTER(c_int)]),
+    ("AbsScpiClient_GetNextError", c_int,
+     [c_void_p, POINTER(c_int16), POINTER(c_char), c_uint]),
+    ("AbsScpiClient_ClearErrors", c_int, [c_void_p]),
+    ("AbsScpiClient_GetAlarms", c_int, [c_void_p, POINTER(c_uint32)]),
+    ("AbsScpiClient_GetInterlockState", c_int, [c_void_p, POINTER(c_bool)]),
+    ("AbsScpiClient_AssertSoftwareInterlock", c_int, [c_void_p]),
+    ("AbsScpiClient_ClearRecoverableAlarms", c_int, [c_void_p]),
+    ("AbsScpiClient_Reboot", c_int, [c_void_p]),
+    ("AbsScpiClient_EnableCell", c_int, [c_void_p, c_uint, c_bool]),
+    ("AbsScpiClient_EnableCellsMasked", c_int, [c_void_p, c_uint, c_bool]),
+    ("AbsScpiClient_GetCellEnabled", c_int,
+     [c_void_p, c_uint, POINTER(c_bool)]),
+    ("AbsScpiClient_GetCellsEnabledMasked", c_int,
+     [c_void_p, POINTER(c_uint)]),
+    ("AbsScpiClient_SetCellVoltage", c_int, [c_void_p, c_uint, c_float]),
+    ("AbsScpiClient_SetAllCellVoltages", c_int,
+     [c_void_p, POINTER(c_float), c_uint]),
+    ("AbsScpiClient_GetCellVoltageTarget", c_int,
+     [c_void_p, c_uint, POINTER(c_float)]),
+    ("AbsScpiClient_GetAllCellVoltageTargets", c_int,
+     [c_void_p, POINTER(c_float), c_uint]),
+    ("AbsScpiClient_SetCellSourcing", c_int, [c_void_p, c_uint, c_float]),
+    ("AbsScpiClient_SetAllCellSourcing", c_int,
+     [c_void_p, POINTER(c_float), c_uint]),
+    ("AbsScpiClient_GetCellSourcingLimit", c_int,
+     [c_void_p, c_uint, POINTER(c_float)]),
+    ("AbsScpiClient_GetAllCellSourcingLimits", c_int,
+     [c_void_p, POINTER(c_float), c_uint]),
+    ("AbsScpiClient_SetCellSinking", c_int, [c_void_p, c_uint, c_float]),
+    ("AbsScpiClient_SetAllCellSinking", c_int,
+     [c_void_p, POINTER(c_float), c_uint]),
+    ("AbsScpiClient_GetCellSinkingLimit", c_int,
+     [c_void_p, c_uint, POINTER(c_float)]),
+    ("AbsScpiClient_GetAllCellSinkingLimits", c_int,
+     [c_void_p, POINTER(c_float), c_uint]),
+    ("AbsScpiClient_SetCellFault", c_int, [c_void_p, c_uint, c_int]),
+    ("AbsScpiClient_SetAllCellFaults", c_int,
+     [c_void_p, POINTER(c_int), c_uint]),
+    ("AbsScpiClient_GetCellFault", c_int, [c_void_p, c_uint, POINTER(c_int)]),
+    ("AbsScpiClient_GetAllCellFaults", c_int,
+     [c_void_p, POINTER(c_int), c_uint]),
+    ("AbsScpiClient_SetCellSenseRange", c_int, [c_void_p, c_uint, c_int]),
+    ("AbsScpiClient_SetAllCellSenseRanges", c_int,
+     [c_void_p, POINTER(c_int), c_uint]),
+    ("AbsScpiClient_GetCellSenseRange", c_int,
+     [c_void_p, c_uint, POINTER(c_int)]),
+    ("AbsScpiClient_GetAllCellSenseRanges", c_int,
+     [c_void_p, POINTER(c_int), c_uint]),
+    ("AbsScpiClient_EnableCellNoiseFilter", c_int, [c_void_p, c_bool]),
+    ("AbsScpiClient_GetCellNoiseFilterEnabled", c_int,
+     [c_void_p, POINTER(c_bool)]),
+    ("AbsScpiClient_MeasureCellVoltage", c_int,
+     [c_void_p, c_uint, POINTER(c_float)]),
+    ("AbsScpiClient_MeasureAllCellVoltages", c_int,
+     [c_void_p, POINTER(c_float), c_uint]),
+    ("AbsScpiClient_MeasureCellCurrent", c_int,
+     [c_void_p, c_uint, POINTER(c_float)]),
+    ("AbsScpiClient_MeasureAllCellCurrents", c_int,
+     [c_void_p, POINTER(c_float), c_uint]),
+    ("AbsScpiClient_GetCellOperatingMode", c_int,
+     [c_void_p, c_uint, POINTER(c_int)]),
+    ("AbsScpiClient_GetAllCellOperatingModes", c_int,
+     [c_void_p, POINTER(c_int), c_uint]),
+    ("AbsScpiClient_SetAnalogOutput", c_int, [c_void_p, c_uint, c_float]),
+    ("AbsScpiClient_SetAllAnalogOutputs", c_int,
+     [c_void_p, POINTER(c_float), c_uint]),
+    ("AbsScpiClient_GetAnalogOutput", c_int,
+     [c_void_p, c_uint, POINTER(c_float)]),
+    ("AbsScpiClient_GetAllAnalogOutputs", c_int,
+     [c_void_p, POINTER(c_float), c_uint]),
+    ("AbsScpiClient_SetDigitalOutput", c_int, [c_void_p, c_uint, c_bool]),
+    ("AbsScpiClient_SetAllDigitalOutputs", c_int, [c_void_p, c_uint]),
+    ("AbsScpiClient_GetDigitalOutput", c_int,
+     [c_void_p, c_uint, POINTER(c_bool)]),
+    ("AbsScpiClient_GetAllDigitalOutputs", c_int,
+     [c_void_p, POINTER(c_uint)]),
+    ("AbsScpiClient_MeasureAnalogInput", c_int,
+     [c_void_p, c_uint, POINTER(c_float)]),
+    ("AbsScpiClient_MeasureAllAnalogInputs", c_int,
+     [c_void_p, POINTER(c_float), c_uint]),
+    ("AbsScpiClient_MeasureDigitalInput", c_int,
+     [c_void_p, c_uint, POINTER(c_bool)]),
+    ("AbsScpiClient_MeasureAllDigitalInputs", c_int,
+     [c_void_p, POINTER(c_uint)]),
+    ("AbsScpiClient_GetModelStatus", c_int, [c_void_p, POINTER(c_uint8)]),
+    ("AbsScpiClient_LoadModel", c_int, [c_void_p]),
+    ("AbsScpiClient_StartModel", c_int, [c_void_p]),
+    ("AbsScpiClient_StopModel", c_int, [c_void_p]),
+    ("AbsScpiClient_UnloadModel", c_int, [c_void_p]),
+    ("AbsScpiClient_GetModelInfo", c_int, [c_void_p, POINTER(AbsModelInfo)]),
+    ("AbsScpiClient_SetGlobalModelInput", c_int, [c_void_p, c_uint, c_float]),
+    ("AbsScpiClient_SetAllGlobalModelInputs", c_int,
+     [c_void_p, POINTER(c_float), c_uint]),
+    ("AbsScpiClient_GetGlobalModelInput", c_int,
+     [c_void_p, c_uint, POINTER(c_float)]),
+    ("AbsScpiClient_GetAllGlobalModelInputs", c_int,
+     [c_void_p, POINTER(c_float), c_uint]),
+    ("AbsScpiClient_SetLocalModelInput", c_int, [c_void_p, c_uint, c_float]),
+    ("AbsScpiClient_SetAllLocalModelInputs", c_int,
+     [c_void_p, POINTER(c_float), c_uint]),
+    ("AbsScpiClient_GetLocalModelInput", c_int,
+     [c_void_p, c_uint, POINTER(c_float)]),
+    ("AbsScpiClient_GetAllLocalModelInputs", c_int,
+     [c_void_p, POINTER(c_float), c_uint]),
+    ("AbsScpiClient_GetModelOutput", c_int,
+     [c_void_p, c_uint, POINTER(c_float)]),
+    ("AbsScpiClient_GetAllModelOutputs", c_int,
+     [c_void_p, POINTER(c_float), c_uint]),
+    ("AbsScpiClient_MulticastDiscovery", c_int,
+     [c_char_p, POINTER(AbsEthernetDiscoveryResult), POINTER(c_uint)]),
+    ("AbsScpiClient_SerialDiscovery", c_int,
+     [c_char_p, c_uint8, c_uint8, POINTER(AbsSerialDiscoveryResult),
+      POINTER(c_uint)]),
+]
+
+@functools.lru_cache(maxsize=None)
+def _load_library(lib: str) -> CDLL:
+    """Find and load the native library and apply the function prototypes.
+
+    The result is cached, so clients created after the first one share the
+    already-loaded library instead of searching for it again.
+
+    Args:
+        lib: Name of or path to the ABS SCPI DLL.
+
+    Returns:
+        The loaded library.
+
+    Raises:
+        OSError: An error occurred while finding or loading the library.
+    """
+    # Both loaders release the GIL for the duration of each native call (only
+    # PyDLL holds it), so blocking calls such as discovery or opening a
+    # connection don't stall other Python threads.
+    if platform.system() == "Windows":
+        load_library_func = windll.LoadLibrary
+    else:
+        load_library_func = cdll.LoadLibrary
+
+    if platform.system() == "Windows" and lib is LIB_NAME:
+        # add the Windows install directory to the lookup path
+        os.environ['PATH'] += f";{os.environ['ProgramFiles']}/Bloomy Controls/absscpi/bin"
+
+    lib_path = find_library(lib)
+    if not lib_path:
+        raise OSError(f"{lib} library not found")
+
+    try:
+        dll = load_library_func(lib_path)
+    except OSError:
+        raise OSError(
+                f"The SCPI library could not be loaded ({lib_path})"
+                ) from None
+
+    for name, restype, argtypes in _DLL_FUNCTIONS:
+        # older versions of the library may lack some functions; only the
+        # wrappers that use them should fail
+        if not hasattr(dll, name):
+            continue
+        fn = getattr(dll, name)
+        fn.restype = restype
+        fn.argtypes = argtypes
+
+    return dll
+
+def _float32_view(values) -> memoryview | None:
+    """Get a view of a contiguous float32 buffer, such as a NumPy float32 array
+    or an ``array.array('f')``.
+
+    Returns:
+        A one-dimensional view of the buffer, or None if the object doesn't
+        expose a contiguous float32 buffer.
+    """
+    if isinstance(values, (list, tuple)):
+        return None
+    try:
+        view = memoryview(values)
+    except TypeError:
+        return None
+    if view.format != "f" or view.ndim != 1 or not view.c_contiguous:
+        return None
+    return view
+
+def _float_array(values) -> Array:
+    """Convert a sequence of floats to a ctypes float array.
+
+    Contiguous float32 buffers are passed through as-is instead of converting
+    each element in Python.
+    """
+    view = _float32_view(values)
+    if view is None:
+        return (c_float * len(values))(*values)
+    if view.readonly:
+        return (c_float * len(view)).from_buffer_copy(view)
+    return (c_float * len(view)).from_buffer(view)
+
+def _encode(s: str | bytes) -> bytes:
+    """Encode a string argument for the native library.
+
+    Bytes are passed through unchanged, letting callers that already hold
+    encoded strings skip the conversion.
+    """
+    return s if isinstance(s, bytes) else s.encode()
+
 class ScpiClient:
     """Client for communicating with the ABS with SCPI.
 
@@ -143,6 +376,16 @@ class ScpiClient:
 
     To re-open the connection with the same or a different communication layer,
     you can simply call the corresponding ``open_*()`` method at any time.
+
+    IP addresses and serial port names may be given either as ``str`` or as
+    ASCII-encoded ``bytes``. Passing ``bytes`` skips encoding the string on
+    each call.
+
+    A client reuses internal buffers between calls, so it must not be used
+    from multiple threads at once without external locking. Use one client
+    per thread instead, or guard the client with a lock. The discovery
+    methods (:meth:`multicast_discovery` and :meth:`serial_discovery`) are the
+    exception and may be called concurrently.
     """
 
     def __init__(self, lib: str = LIB_NAME):
@@ -160,26 +403,27 @@ class ScpiClient:
                 library.
         """
         self.__handle = c_void_p()
+        # raw handle value, which ctypes converts faster than a c_void_p
+        self.__h = None
+        self.__cell_voltage_buf = (c_float * CELL_COUNT)()
+        self.__cell_target_buf = (c_float * CELL_COUNT)()
+        self.__cal_date_buf = create_string_buffer(128)
+        self.__error_buf = create_string_buffer(256)
 
-        if platform.system() == "Windows":
-            load_library_func = windll.LoadLibrary
-        else:
-            load_library_func = cdll.LoadLibrary
-
-        if platform.system() == "Windows" and lib is LIB_NAME:
-            # add the Windows install directory to the lookup path
-            os.environ['PATH'] += f";{os.environ['ProgramFiles']}/Bloomy Controls/absscpi/bin"
+        self.__dll = _load_library(lib)
+        self.__bind()
 
-        lib_path = find_library(lib)
-        if not lib_path:
-            raise OSError(f"{lib} library not found")
+    def __bind(self):
+        """Cache the library's functions on the client.
 
-        try:
-            self.__dll = load_library_func(lib_path)
-        except OSError:
-            raise OSError(
-                    f"The SCPI library could not be loaded ({lib_path})"
-                    ) from None
+        Each function is stored as ``_<name>`` so that calls don't have to look
+        it up through the library object. Functions missing from the library
+        are skipped, so only the wrappers that call them raise
+        ``AttributeError``.
+        """
+        for name, _, _ in _DLL_FUNCTIONS:
+            if hasattr(self.__dll, name):
+                setattr(self, "_" + name, getattr(self.__dll, name))
 
     def __enter__(self):
         self.init()
@@ -197,21 +441,21 @@ class ScpiClient:
         Returns:
             A message describing the error code.
         """
-        self.__dll.AbsScpiClient_ErrorMessage.restype = c_char_p
-        ret = self.__dll.AbsScpiClient_ErrorMessage(err)
-        return ret.decode()
+        return self._AbsScpiClient_ErrorMessage(err).decode()
+
+    def __error(self, err: int) -> ScpiClientError:
+        """Create an exception for an error code returned by a driver function.
 
-    def __check_err(self, err: int):
-        """Check a return value and throw an exception if it's an error.
+        Callers check for ``res < 0`` themselves so that a successful call
+        doesn't pay for a method call.
 
         Args:
             err: The error code returned by a driver function.
 
-        Raises:
-            ScpiClientError: The error code is not successful.
+        Returns:
+            An exception describing the error.
         """
-        if err < 0:
-            raise ScpiClientError(self.__err_msg(err))
+        return ScpiClientError(self.__err_msg(err))
 
     def init(self):
         """Initialize the client handle.
@@ -227,8 +471,10 @@ class ScpiClient:
         Raises:
             ScpiClientError: An error occurred during initialization.
         """
-        res = self.__dll.AbsScpiClient_Init(byref(self.__handle))
-        self.__check_err(res)
+        res = self._AbsScpiClient_Init(byref(self.__handle))
+        if res < 0:
+            raise self.__error(res)
+        self.__h = self.__handle.value
 
     def cleanup(self):
         """Cleanup the client handle.
@@ -241,9 +487,14 @@ class ScpiClient:
               with ScpiClient() as client:
                   ...
         """
-        self.__dll.AbsScpiClient_Destroy(byref(self.__handle))
+        self._AbsScpiClient_Destroy(byref(self.__handle))
+        self.__h = self.__handle.value
 
-    def open_udp(self, target_ip: str, interface_ip: str | None = None):
+    def open_udp(
+        self,
+        target_ip: str | bytes,
+        interface_ip: str | bytes | None = None,
+    ):
         """Open a UDP connection to the ABS.
 
         Args:
@@ -255,12 +506,13 @@ class ScpiClient:
         Raises:
             ScpiClientError: An error occurred while opening the socket.
         """
-        res = self.__dll.AbsScpiClient_OpenUdp(
-                self.__handle, target_ip.encode(),
-                interface_ip.encode() if interface_ip else None)
-        self.__check_err(res)
+        res = self._AbsScpiClient_OpenUdp(
+                self.__h, _encode(target_ip),
+                _encode(interface_ip) if interface_ip else None)
+        if res < 0:
+            raise self.__error(res)
 
-    def open_tcp(self, target_ip: str):
+    def open_tcp(self, target_ip: str | bytes):
         """Open a TCP connection to the ABS.
 
         Args:
@@ -269,11 +521,12 @@ class ScpiClient:
         Raises:
             ScpiClientError: An error occurred while attempting to connect.
         """
-        res = self.__dll.AbsScpiClient_OpenTcp(
-                self.__handle, target_ip.encode())
-        self.__check_err(res)
+        res = self._AbsScpiClient_OpenTcp(
+                self.__h, _encode(target_ip))
+        if res < 0:
+            raise self.__error(res)
 
-    def open_serial(self, port: str, device_id: int):
+    def open_serial(self, port: str | bytes, device_id: int):
         """Open a serial connection to the device.
 
         Args:
@@ -286,9 +539,10 @@ class ScpiClient:
         """
         if device_id < 0:
             raise ValueError(f"device ID out of range: {device_id}")
-        res = self.__dll.AbsScpiClient_OpenSerial(
-                self.__handle, port.encode(), c_uint(device_id))
-        self.__check_err(res)
+        res = self._AbsScpiClient_OpenSerial(
+                self.__h, _encode(port), device_id)
+        if res < 0:
+            raise self.__error(res)
 
     def close(self):
         """Close client connection.
@@ -298,10 +552,11 @@ class ScpiClient:
         Raises:
             ScpiClientError: An error occurred while closing the connection.
         """
-        res = self.__dll.AbsScpiClient_Close(self.__handle)
-        self.__check_err(res)
+        res = self._AbsScpiClient_Close(self.__h)
+        if res < 0:
+            raise self.__error(res)
 
-    def open_udp_multicast(self, interface_ip: str):
+    def open_udp_multicast(self, interface_ip: str | bytes):
         """Open a UDP multicast socket for broadcasting to many ABSes.
 
         Args:
@@ -310,9 +565,10 @@ class ScpiClient:
         Raises:
             ScpiClientError: An error occurred while opening the socket.
         """
-        res = self.__dll.AbsScpiClient_OpenUdpMulticast(
-                self.__handle, interface_ip.encode())
-        self.__check_err(res)
+        res = self._AbsScpiClient_OpenUdpMulticast(
+                self.__h, _encode(interface_ip))
+        if res < 0:
+            raise self.__error(res)
 
     def set_target_device_id(self, device_id: int):
         """Set the target device ID for communications.
@@ -328,9 +584,10 @@ class ScpiClient:
         """
         if device_id < 0:
             raise ValueError(f"device ID out of range: {device_id}")
-        res = self.__dll.AbsScpiClient_SetTargetDeviceId(
-                self.__handle, c_uint(device_id))
-        self.__check_err(res)
+        res = self._AbsScpiClient_SetTargetDeviceId(
+                self.__h, device_id)
+        if res < 0:
+            raise self.__error(res)
 
     def get_target_device_id(self) -> int:
         """Get the target device ID for communications.
@@ -344,9 +601,10 @@ class ScpiClient:
             ScpiClientError: An error occurred while getting the ID.
         """
         dev_id = c_uint()
-        res = self.__dll.AbsScpiClient_GetTargetDeviceId(
-                self.__handle, byref(dev_id))
-        self.__check_err(res)
+        res = self._AbsScpiClient_GetTargetDeviceId(
+                self.__h, byref(dev_id))
+        if res < 0:
+            raise self.__error(res)
         return dev_id.value
 
     def get_device_info(self) -> AbsDeviceInfo:
@@ -359,9 +617,10 @@ class ScpiClient:
             ScpiClientError: An error occurred while opening the port.
         """
         info = AbsDeviceInfo()
-        res = self.__dll.AbsScpiClient_GetDeviceInfo(
-                self.__handle, byref(info))
-        self.__check_err(res)
+        res = self._AbsScpiClient_GetDeviceInfo(
+                self.__h, byref(info))
+        if res < 0:
+            raise self.__error(res)
         return info
 
     def get_device_id(self) -> int:
@@ -374,9 +633,10 @@ class ScpiClient:
             ScpiClientError: An error occurred querying the device.
         """
         dev_id = c_uint8()
-        res = self.__dll.AbsScpiClient_GetDeviceId(
-                self.__handle, byref(dev_id))
-        self.__check_err(res)
+        res = self._AbsScpiClient_GetDeviceId(
+                self.__h, byref(dev_id))
+        if res < 0:
+            raise self.__error(res)
         return dev_id.value
 
     def get_ip_address(self) -> AbsEthernetConfig:
@@ -389,12 +649,13 @@ class ScpiClient:
             ScpiClientError: An error occurred querying the device.
         """
         conf = AbsEthernetConfig()
-        res = self.__dll.AbsScpiClient_GetIPAddress(
-                self.__handle, byref(conf))
-        self.__check_err(res)
+        res = self._AbsScpiClient_GetIPAddress(
+                self.__h, byref(conf))
+        if res < 0:
+            raise self.__error(res)
         return conf
 
-    def set_ip_address(self, ip: str, netmask: str):
+    def set_ip_address(self, ip: str | bytes, netmask: str | bytes):
         """Set the device's IP address and subnet mask.
 
         For TCP and UDP connections, you must close and reopen the connection.
@@ -408,13 +669,11 @@ class ScpiClient:
         Raises:
             ScpiClientError: An error occurred sending the command.
         """
-        conf = AbsEthernetConfig()
-        conf.ip = ip.encode()
-        conf.netmask = netmask.encode()
-        res = self.__dll.AbsScpiClient_SetIPAddress(
-                self.__handle, byref(conf))
-        self.__check_err(res)
-        return conf
+        conf = AbsEthernetConfig(_encode(ip), _encode(netmask))
+        res = self._AbsScpiClient_SetIPAddress(
+                self.__h, byref(conf))
+        if res < 0:
+            raise self.__error(res)
 
     def get_calibration_date(self) -> str:
         """Query the device's calibration date.
@@ -425,10 +684,11 @@ class ScpiClient:
         Raises:
             ScpiClientError: An error occurred while executing the query.
         """
-        buf = create_string_buffer(128)
-        res = self.__dll.AbsScpiClient_GetCalibrationDate(
-                self.__handle, byref(buf), c_uint(len(buf)))
-        self.__check_err(res)
+        buf = self.__cal_date_buf
+        res = self._AbsScpiClient_GetCalibrationDate(
+                self.__h, buf, len(buf))
+        if res < 0:
+            raise self.__error(res)
         return buf.value.decode()
 
     def get_error_count(self) -> int:
@@ -441,9 +701,10 @@ class ScpiClient:
             ScpiClientError: An error occurred while executing the query.
         """
         count = c_int()
-        res = self.__dll.AbsScpiClient_GetErrorCount(
-                self.__handle, byref(count))
-        self.__check_err(res)
+        res = self._AbsScpiClient_GetErrorCount(
+                self.__h, byref(count))
+        if res < 0:
+            raise self.__error(res)
         return count.value
 
     def get_next_error(self) -> tuple[int, str] | None:
@@ -456,11 +717,12 @@ class ScpiClient:
         Raises:
             ScpiClientError: An error occurred while executing the query.
         """
-        buf = create_string_buffer(256)
+        buf = self.__error_buf
         code = c_int16()
-        res = self.__dll.AbsScpiClient_GetNextError(
-                self.__handle, byref(code), byref(buf), c_uint(len(buf)))
-        self.__check_err(res)
+        res = self._AbsScpiClient_GetNextError(
+                self.__h, byref(code), buf, len(buf))
+        if res < 0:
+            raise self.__error(res)
         if code.value == 0:
             return None
         return (code.value, buf.value.decode())
@@ -471,8 +733,9 @@ class ScpiClient:
         Raises:
             ScpiClientError: An error occurred while sending the command.
         """
-        res = self.__dll.AbsScpiClient_ClearErrors(self.__handle)
-        self.__check_err(res)
+        res = self._AbsScpiClient_ClearErrors(self.__h)
+        if res < 0:
+            raise self.__error(res)
 
     def get_alarms(self) -> int:
         """Query the alarms raised on the device.
@@ -484,8 +747,9 @@ class ScpiClient:
             ScpiClientError: An error occurred while executing the query.
         """
         alarms = c_uint32()
-        res = self.__dll.AbsScpiClient_GetAlarms(self.__handle, byref(alarms))
-        self.__check_err(res)
+        res = self._AbsScpiClient_GetAlarms(self.__h, byref(alarms))
+        if res < 0:
+            raise self.__error(res)
         return alarms.value
 
     def get_interlock_state(self) -> bool:
@@ -500,9 +764,10 @@ class ScpiClient:
             ScpiClientError: An error occurred while executing the query.
         """
         state = c_bool()
-        res = self.__dll.AbsScpiClient_GetInterlockState(
-                self.__handle, byref(state))
-        self.__check_err(res)
+        res = self._AbsScpiClient_GetInterlockState(
+                self.__h, byref(state))
+        if res < 0:
+            raise self.__error(res)
         return state.value
 
     def assert_soft_interlock(self):
@@ -514,8 +779,9 @@ class ScpiClient:
         Raises:
             ScpiClientError: An error occurred while sending the command.
         """
-        res = self.__dll.AbsScpiClient_AssertSoftwareInterlock(self.__handle)
-        self.__check_err(res)
+        res = self._AbsScpiClient_AssertSoftwareInterlock(self.__h)
+        if res < 0:
+            raise self.__error(res)
 
     def clear_recoverable_alarms(self):
         """Clear any recoverable alarms raised on the unit (including software
@@ -524,8 +790,9 @@ class ScpiClient:
         Raises:
             ScpiClientError: An error occurred while sending the command.
         """
-        res = self.__dll.AbsScpiClient_ClearRecoverableAlarms(self.__handle)
-        self.__check_err(res)
+        res = self._AbsScpiClient_ClearRecoverableAlarms(self.__h)
+        if res < 0:
+            raise self.__error(res)
 
     def reboot(self):
         """Reboot the device, resetting it to its POR state.
@@ -536,7 +803,9 @@ class ScpiClient:
         Raises:
             ScpiClientError: An error occurred while sending the command.
         """
-        self.__check_err(self.__dll.AbsScpiClient_Reboot(self.__handle))
+        res = self._AbsScpiClient_Reboot(self.__h)
+        if res < 0:
+            raise self.__error(res)
 
     def enable_cell(self, cell: int, en: bool):
         """Enable or disable a single cell.
@@ -548,9 +817,10 @@ class ScpiClient:
         Raises:
             ScpiClientError: An error occurred while enabling the cell.
         """
-        res = self.__dll.AbsScpiClient_EnableCell(
-                self.__handle, c_uint(cell), c_bool(en))
-        self.__check_err(res)
+        res = self._AbsScpiClient_EnableCell(
+                self.__h, cell, en)
+        if res < 0:
+            raise self.__error(res)
 
     def enable_all_cells(self, en: list[bool]):
         """Enable or disable many cells.
@@ -576,14 +846,16 @@ class ScpiClient:
                 cells_off |= 1 << i
 
         if cells_on != 0:
-            res = self.__dll.AbsScpiClient_EnableCellsMasked(
-                    self.__handle, c_uint(cells_on), True)
-            self.__check_err(res)
+            res = self._AbsScpiClient_EnableCellsMasked(
+                    self.__h, cells_on, True)
+            if res < 0:
+                raise self.__error(res)
 
         if cells_off != 0:
-            res = self.__dll.AbsScpiClient_EnableCellsMasked(
-                    self.__handle, c_uint(cells_off), False)
-            self.__check_err(res)
+            res = self._AbsScpiClient_EnableCellsMasked(
+                    self.__h, cells_off, False)
+            if res < 0:
+                raise self.__error(res)
 
     def get_cell_enabled(self, cell: int) -> bool:
         """Query the enable state of a single cell.
@@ -598,9 +870,10 @@ class ScpiClient:
             ScpiClientError: An error occurred while executing the query.
         """
         en = c_bool()
-        res = self.__dll.AbsScpiClient_GetCellEnabled(
-                self.__handle, c_uint(cell), byref(en))
-        self.__check_err(res)
+        res = self._AbsScpiClient_GetCellEnabled(
+                self.__h, cell, byref(en))
+        if res < 0:
+            raise self.__error(res)
         return en.value
 
     def get_all_cells_enabled(self) -> list[bool]:
@@ -613,9 +886,10 @@ class ScpiClient:
             ScpiClientError: An error occurred while executing the query.
         """
         states = c_uint()
-        res = self.__dll.AbsScpiClient_GetCellsEnabledMasked(
-                self.__handle, byref(states))
-        self.__check_err(res)
+        res = self._AbsScpiClient_GetCellsEnabledMasked(
+                self.__h, byref(states))
+        if res < 0:
+            raise self.__error(res)
         state_list = [False] * CELL_COUNT
         for i in range(CELL_COUNT):
             if (states.value & (1 << i)) != 0:
@@ -632,24 +906,34 @@ class ScpiClient:
         Raises:
             ScpiClientError: An error occurred while sending the command.
         """
-        res = self.__dll.AbsScpiClient_SetCellVoltage(
-                self.__handle, c_uint(cell), c_float(voltage))
-        self.__check_err(res)
+        res = self._AbsScpiClient_SetCellVoltage(
+                self.__h, cell, voltage)
+        if res < 0:
+            raise self.__error(res)
 
     def set_all_cell_voltages(self, voltages: list[float]):
         """Set all cells' voltages.
 
         Args:
             voltages: Array of cell voltages. Must not be empty or longer than
-                the total cell count.
+                the total cell count. A contiguous float32 array (such as a
+                NumPy ``float32`` array) is passed to the driver without
+                converting each element.
 
         Raises:
             ScpiClientError: An error occurred while sending the command.
         """
-        vals = (c_float * len(voltages))(*voltages)
-        res = self.__dll.AbsScpiClient_SetAllCellVoltages(
-                self.__handle, byref(vals), c_uint(len(voltages)))
-        self.__check_err(res)
+        count = len(voltages)
+        if isinstance(voltages, (list, tuple)) and count <= CELL_COUNT:
+            # filling the preallocated array is much cheaper than building a
+            # new one for every update
+            vals = self.__cell_voltage_buf
+            vals[:count] = voltages
+        else:
+            vals = _float_array(voltages)
+        res = self._AbsScpiClient_SetAllCellVoltages(self.__h, vals, count)
+        if res < 0:
+            raise self.__error(res)
 
     def get_cell_voltage_target(self, cell: int) -> float:
         """Query a single cell's target voltage.
@@ -664,25 +948,46 @@ class ScpiClient:
             ScpiClientError: An error occurred while executing the query.
         """
         voltage = c_float()
-        res = self.__dll.AbsScpiClient_GetCellVoltageTarget(
-                self.__handle, c_uint(cell), byref(voltage))
-        self.__check_err(res)
+        res = self._AbsScpiClient_GetCellVoltageTarget(
+                self.__h, cell, byref(voltage))
+        if res < 0:
+            raise self.__error(res)
         return voltage.value
 
-    def get_all_cell_voltage_targets(self) -> list[float]:
+    def get_all_cell_voltage_targets(
+        self,
+        out: Any = None,
+    ) -> list[float] | Any:
         """Query all cells' target voltages.
 
+        Args:
+            out: Optional writable, contiguous float32 array (such as a NumPy
+                ``float32`` array) with room for one voltage per cell. If
+                given, the voltages are written directly into it and it is
+                returned instead of a new list.
+
         Returns:
-            An array of voltages, one per cell.
+            A list of voltages, one per cell, or ``out`` (filled with the
+            voltages) if it was given.
 
         Raises:
+            ValueError: ``out`` is not a writable float32 array with room for
+                every cell.
             ScpiClientError: An error occurred while executing the query.
         """
-        voltages = (c_float * CELL_COUNT)()
-        res = self.__dll.AbsScpiClient_GetAllCellVoltageTargets(
-                self.__handle, byref(voltages), c_uint(CELL_COUNT))
-        self.__check_err(res)
-        return voltages[:]
+        if out is None:
+            voltages = self.__cell_target_buf
+        else:
+            view = _float32_view(out)
+            if view is None or view.readonly or len(view) < CELL_COUNT:
+                raise ValueError("out must be a writable float32 array with "
+                                 f"at least {CELL_COUNT} elements")
+            voltages = (c_float * CELL_COUNT).from_buffer(view)
+        res = self._AbsScpiClient_GetAllCellVoltageTargets(
+                self.__h, voltages, CELL_COUNT)
+        if res < 0:
+            raise self.__error(res)
+        return voltages[:] if out is None else out
 
     def set_cell_sourcing(self, cell: int, limit: float):
         """Set a single cell's current sourcing limit.
@@ -694,9 +999,10 @@ class ScpiClient:
         Raises:
             ScpiClientError: An error occurred while sending the command.
         """
-        res = self.__dll.AbsScpiClient_SetCellSourcing(
-                self.__handle, c_uint(cell), c_float(limit))
-        self.__check_err(res)
+        res = self._AbsScpiClient_SetCellSourcing(
+                self.__h, cell, limit)
+        if res < 0:
+            raise self.__error(res)
 
     def set_all_cell_sourcing(self, limits: list[float]):
         """Set all cells' current sourcing limits.
@@ -708,10 +1014,11 @@ class ScpiClient:
         Raises:
             ScpiClientError: An error occurred while sending the command.
         """
-        vals = (c_float * len(limits))(*limits)
-        res = self.__dll.AbsScpiClient_SetAllCellSourcing(
-                self.__handle, byref(vals), c_uint(len(limits)))
-        self.__check_err(res)
+        vals = _float_array(limits)
+        res = self._AbsScpiClient_SetAllCellSourcing(
+                self.__h, vals, len(limits))
+        if res < 0:
+            raise self.__error(res)
 
     def get_cell_sourcing_limit(self, cell: int) -> float:
         """Query a single cell's current sourcing limit.
@@ -726,9 +1033,10 @@ class ScpiClient:
             ScpiClientError: An error occurred while executing the query.
         """
         limit = c_float()
-        res = self.__dll.AbsScpiClient_GetCellSourcingLimit(
-                self.__handle, c_uint(cell), byref(limit))
-        self.__check_err(res)
+        res = self._AbsScpiClient_GetCellSourcingLimit(
+                self.__h, cell, byref(limit))
+        if res < 0:
+            raise self.__error(res)
         return limit.value
 
     def get_all_cell_sourcing_limits(self) -> list[float]:
@@ -741,9 +1049,10 @@ class ScpiClient:
             ScpiClientError: An error occurred while executing the query.
         """
         limits = (c_float * CELL_COUNT)()
-        res = self.__dll.AbsScpiClient_GetAllCellSourcingLimits(
-                self.__handle, byref(limits), c_uint(CELL_COUNT))
-        self.__check_err(res)
+        res = self._AbsScpiClient_GetAllCellSourcingLimits(
+                self.__h, limits, CELL_COUNT)
+        if res < 0:
+            raise self.__error(res)
         return limits[:]
 
     def set_cell_sinking(self, cell: int, limit: float):
@@ -756,9 +1065,10 @@ class ScpiClient:
         Raises:
             ScpiClientError: An error occurred while sending the command.
         """
-        res = self.__dll.AbsScpiClient_SetCellSinking(
-                self.__handle, c_uint(cell), c_float(limit))
-        self.__check_err(res)
+        res = self._AbsScpiClient_SetCellSinking(
+                self.__h, cell, limit)
+        if res < 0:
+            raise self.__error(res)
 
     def set_all_cell_sinking(self, limits: list[float]):
         """Set all cells' current sinking limits.
@@ -770,10 +1080,11 @@ class ScpiClient:
         Raises:
             ScpiClientError: An error occurred while sending the command.
         """
-        vals = (c_float * len(limits))(*limits)
-        res = self.__dll.AbsScpiClient_SetAllCellSinking(
-                self.__handle, byref(vals), c_uint(len(limits)))
-        self.__check_err(res)
+        vals = _float_array(limits)
+        res = self._AbsScpiClient_SetAllCellSinking(
+                self.__h, vals, len(limits))
+        if res < 0:
+            raise self.__error(res)
 
     def get_cell_sinking_limit(self, cell: int) -> float:
         """Query a single cell's current sinking limit.
@@ -788,9 +1099,10 @@ class ScpiClient:
             ScpiClientError: An error occurred while executing the query.
         """
         limit = c_float()
-        res = self.__dll.AbsScpiClient_GetCellSinkingLimit(
-                self.__handle, c_uint(cell), byref(limit))
-        self.__check_err(res)
+        res = self._AbsScpiClient_GetCellSinkingLimit(
+                self.__h, cell, byref(limit))
+        if res < 0:
+            raise self.__error(res)
         return limit.value
 
     def get_all_cell_sinking_limits(self) -> list[float]:
@@ -803,9 +1115,10 @@ class ScpiClient:
             ScpiClientError: An error occurred while executing the query.
         """
         limits = (c_float * CELL_COUNT)()
-        res = self.__dll.AbsScpiClient_GetAllCellSinkingLimits(
-                self.__handle, byref(limits), c_uint(CELL_COUNT))
-        self.__check_err(res)
+        res = self._AbsScpiClient_GetAllCellSinkingLimits(
+                self.__h, limits, CELL_COUNT)
+        if res < 0:
+            raise self.__error(res)
         return limits[:]
 
     def set_cell_fault(self, cell: int, fault: AbsCellFault):
@@ -818,9 +1131,10 @@ class ScpiClient:
         Raises:
             ScpiClientError: An error occurred while sending the command.
         """
-        res = self.__dll.AbsScpiClient_SetCellFault(
-                self.__handle, c_uint(cell), c_int(fault.value))
-        self.__check_err(res)
+        res = self._AbsScpiClient_SetCellFault(
+                self.__h, cell, fault)
+        if res < 0:
+            raise self.__error(res)
 
     def set_all_cell_faults(self, faults: list[AbsCellFault]):
         """Set all cells' faulting states.
@@ -833,9 +1147,10 @@ class ScpiClient:
             ScpiClientError: An error occurred while sending the command.
         """
         vals = (c_int * len(faults))(*faults)
-        res = self.__dll.AbsScpiClient_SetAllCellFaults(
-                self.__handle, byref(vals), c_uint(len(faults)))
-        self.__check_err(res)
+        res = self._AbsScpiClient_SetAllCellFaults(
+                self.__h, vals, len(faults))
+        if res < 0:
+            raise self.__error(res)
 
     def get_cell_fault(self, cell: int) -> AbsCellFault:
         """Query a single cell's faulting state.
@@ -850,9 +1165,10 @@ class ScpiClient:
             ScpiClientError: An error occurred while executing the query.
         """
         state = c_int()
-        res = self.__dll.AbsScpiClient_GetCellFault(
-                self.__handle, c_uint(cell), byref(state))
-        self.__check_err(res)
+        res = self._AbsScpiClient_GetCellFault(
+                self.__h, cell, byref(state))
+        if res < 0:
+            raise self.__error(res)
         return AbsCellFault(state.value)
 
     def get_all_cell_faults(self) -> list[AbsCellFault]:
@@ -865,9 +1181,10 @@ class ScpiClient:
             ScpiClientError: An error occurred while executing the query.
         """
         states = (c_int * CELL_COUNT)()
-        res = self.__dll.AbsScpiClient_GetAllCellFaults(
-                self.__handle, byref(states), c_uint(CELL_COUNT))
-        self.__check_err(res)
+        res = self._AbsScpiClient_GetAllCellFaults(
+                self.__h, states, CELL_COUNT)
+        if res < 0:
+            raise self.__error(res)
         return [AbsCellFault(state) for state in states]
 
     def set_cell_sense_range(self, cell: int, range_: AbsCellSenseRange):
@@ -884,9 +1201,10 @@ class ScpiClient:
         Raises:
             ScpiClientError: An error occurred while sending the command.
         """
-        res = self.__dll.AbsScpiClient_SetCellSenseRange(
-                self.__handle, c_uint(cell), c_int(range_.value))
-        self.__check_err(res)
+        res = self._AbsScpiClient_SetCellSenseRange(
+                self.__h, cell, range_)
+        if res < 0:
+            raise self.__error(res)
 
     def set_all_cell_sense_ranges(self, ranges: list[AbsCellSenseRange]):
         """Set all cells' current sense ranges.
@@ -903,9 +1221,10 @@ class ScpiClient:
             ScpiClientError: An error occurred while sending the command.
         """
         vals = (c_int * len(ranges))(*ranges)
-        res = self.__dll.AbsScpiClient_SetAllCellSenseRanges(
-                self.__handle, byref(vals), c_uint(len(ranges)))
-        self.__check_err(res)
+        res = self._AbsScpiClient_SetAllCellSenseRanges(
+                self.__h, vals, len(ranges))
+        if res < 0:
+            raise self.__error(res)
 
     def get_cell_sense_range(self, cell: int) -> AbsCellSenseRange:
         """Query a single cell's current sense range.
@@ -920,9 +1239,10 @@ class ScpiClient:
             ScpiClientError: An error occurred while executing the query.
         """
         range_ = c_int()
-        res = self.__dll.AbsScpiClient_GetCellSenseRange(
-                self.__handle, c_uint(cell), byref(range_))
-        self.__check_err(res)
+        res = self._AbsScpiClient_GetCellSenseRange(
+                self.__h, cell, byref(range_))
+        if res < 0:
+            raise self.__error(res)
         return AbsCellSenseRange(range_.value)
 
     def get_all_cell_sense_ranges(self) -> list[AbsCellSenseRange]:
@@ -935,9 +1255,10 @@ class ScpiClient:
             ScpiClientError: An error occurred while executing the query.
         """
         ranges = (c_int * CELL_COUNT)()
-        res = self.__dll.AbsScpiClient_GetAllCellSenseRanges(
-                self.__handle, byref(ranges), c_uint(CELL_COUNT))
-        self.__check_err(res)
+        res = self._AbsScpiClient_GetAllCellSenseRanges(
+                self.__h, ranges, CELL_COUNT)
+        if res < 0:
+            raise self.__error(res)
         return [AbsCellSenseRange(r) for r in ranges]
 
     def enable_cell_noise_filter(self, en: bool):
@@ -952,9 +1273,10 @@ class ScpiClient:
         Raises:
             ScpiClientError: An error occurred while sending the command.
         """
-        res = self.__dll.AbsScpiClient_EnableCellNoiseFilter(
-                self.__handle, c_bool(en))
-        self.__check_err(res)
+        res = self._AbsScpiClient_EnableCellNoiseFilter(
+                self.__h, en)
+        if res < 0:
+            raise self.__error(res)
 
     def get_cell_noise_filter_enabled(self) -> bool:
         """Query the enable state of the cell 50/60Hz noise filter.
@@ -966,9 +1288,10 @@ class ScpiClient:
             ScpiClientError: An error occurred while executing the query.
         """
         en = c_bool()
-        res = self.__dll.AbsScpiClient_GetCellNoiseFilterEnabled(
-                self.__handle, byref(en))
-        self.__check_err(res)
+        res = self._AbsScpiClient_GetCellNoiseFilterEnabled(
+                self.__h, byref(en))
+        if res < 0:
+            raise self.__error(res)
         return en.value
 
     def measure_cell_voltage(self, cell: int) -> float:
@@ -984,9 +1307,10 @@ class ScpiClient:
             ScpiClientError: An error occurred while executing the query.
         """
         voltage = c_float()
-        res = self.__dll.AbsScpiClient_MeasureCellVoltage(
-                self.__handle, c_uint(cell), byref(voltage))
-        self.__check_err(res)
+        res = self._AbsScpiClient_MeasureCellVoltage(
+                self.__h, cell, byref(voltage))
+        if res < 0:
+            raise self.__error(res)
         return voltage.value
 
     def measure_all_cell_voltages(self) -> list[float]:
@@ -999,9 +1323,10 @@ class ScpiClient:
             ScpiClientError: An error occurred while executing the query.
         """
         voltages = (c_float * CELL_COUNT)()
-        res = self.__dll.AbsScpiClient_MeasureAllCellVoltages(
-                self.__handle, byref(voltages), c_uint(CELL_COUNT))
-        self.__check_err(res)
+        res = self._AbsScpiClient_MeasureAllCellVoltages(
+                self.__h, voltages, CELL_COUNT)
+        if res < 0:
+            raise self.__error(res)
         return voltages[:]
 
     def measure_cell_current(self, cell: int) -> float:
@@ -1017,9 +1342,10 @@ class ScpiClient:
             ScpiClientError: An error occurred while executing the query.
         """
         current = c_float()
-        res = self.__dll.AbsScpiClient_MeasureCellCurrent(
-                self.__handle, c_uint(cell), byref(current))
-        self.__check_err(res)
+        res = self._AbsScpiClient_MeasureCellCurrent(
+                self.__h, cell, byref(current))
+        if res < 0:
+            raise self.__error(res)
         return current.value
 
     def measure_all_cell_currents(self) -> list[float]:
@@ -1032,9 +1358,10 @@ class ScpiClient:
             ScpiClientError: An error occurred while executing the query.
         """
         currents = (c_float * CELL_COUNT)()
-        res = self.__dll.AbsScpiClient_MeasureAllCellCurrents(
-                self.__handle, byref(currents), c_uint(CELL_COUNT))
-        self.__check_err(res)
+        res = self._AbsScpiClient_MeasureAllCellCurrents(
+                self.__h, currents, CELL_COUNT)
+        if res < 0:
+            raise self.__error(res)
         return currents[:]
 
     def get_cell_operating_mode(self, cell: int) -> AbsCellMode:
@@ -1051,9 +1378,10 @@ class ScpiClient:
             ScpiClientError: An error occurred while executing the query.
         """
         mode = c_int()
-        res = self.__dll.AbsScpiClient_GetCellOperatingMode(
-                self.__handle, c_uint(cell), byref(mode))
-        self.__check_err(res)
+        res = self._AbsScpiClient_GetCellOperatingMode(
+                self.__h, cell, byref(mode))
+        if res < 0:
+            raise self.__error(res)
         return AbsCellMode(mode.value)
 
     def get_all_cell_operating_modes(self) -> list[AbsCellMode]:
@@ -1067,9 +1395,10 @@ class ScpiClient:
             ScpiClientError: An error occurred while executing the query.
         """
         modes = (c_int * CELL_COUNT)()
-        res = self.__dll.AbsScpiClient_GetAllCellOperatingModes(
-                self.__handle, byref(modes), c_uint(CELL_COUNT))
-        self.__check_err(res)
+        res = self._AbsScpiClient_GetAllCellOperatingModes(
+                self.__h, modes, CELL_COUNT)
+        if res < 0:
+            raise self.__error(res)
         return [AbsCellMode(m) for m in modes]
 
     def set_analog_output(self, channel: int, voltage: float):
@@ -1082,9 +1411,10 @@ class ScpiClient:
         Raises:
             ScpiClientError: An error occurred while executing the command.
         """
-        res = self.__dll.AbsScpiClient_SetAnalogOutput(
-                self.__handle, c_uint(channel), c_float(voltage))
-        self.__check_err(res)
+        res = self._AbsScpiClient_SetAnalogOutput(
+                self.__h, channel, voltage)
+        if res < 0:
+            raise self.__error(res)
 
     def set_all_analog_outputs(self, voltages: list[float]):
         """Set all analog output voltages.
@@ -1096,10 +1426,11 @@ class ScpiClient:
         Raises:
             ScpiClientError: An error occurred while executing the command.
         """
-        vals = (c_float * len(voltages))(*voltages)
-        res = self.__dll.AbsScpiClient_SetAllAnalogOutputs(
-                self.__handle, byref(vals), c_uint(len(voltages)))
-        self.__check_err(res)
+        vals = _float_array(voltages)
+        res = self._AbsScpiClient_SetAllAnalogOutputs(
+                self.__h, vals, len(voltages))
+        if res < 0:
+            raise self.__error(res)
 
     def get_analog_output(self, channel: int) -> float:
         """Query an analog output's set point.
@@ -1114,9 +1445,10 @@ class ScpiClient:
             ScpiClientError: An error occurred while executing the query.
         """
         voltage = c_float()
-        res = self.__dll.AbsScpiClient_GetAnalogOutput(
-                self.__handle, c_uint(channel), byref(voltage))
-        self.__check_err(res)
+        res = self._AbsScpiClient_GetAnalogOutput(
+                self.__h, channel, byref(voltage))
+        if res < 0:
+            raise self.__error(res)
         return voltage.value
 
     def get_all_analog_outputs(self) -> list[float]:
@@ -1129,9 +1461,10 @@ class ScpiClient:
             ScpiClientError: An error occurred while executing the query.
         """
         voltages = (c_float * ANALOG_OUTPUT_COUNT)()
-        res = self.__dll.AbsScpiClient_GetAllAnalogOutputs(
-                self.__handle, byref(voltages), c_uint(ANALOG_OUTPUT_COUNT))
-        self.__check_err(res)
+        res = self._AbsScpiClient_GetAllAnalogOutputs(
+                self.__h, voltages, ANALOG_OUTPUT_COUNT)
+        if res < 0:
+            raise self.__error(res)
         return voltages[:]
 
     def set_digital_output(self, channel: int, level: bool):
@@ -1144,9 +1477,10 @@ class ScpiClient:
         Raises:
             ScpiClientError: An error occurred while sending the command.
         """
-        res = self.__dll.AbsScpiClient_SetDigitalOutput(
-                self.__handle, c_uint(channel), c_bool(level))
-        self.__check_err(res)
+        res = self._AbsScpiClient_SetDigitalOutput(
+                self.__h, channel, level)
+        if res < 0:
+            raise self.__error(res)
 
     def set_all_digital_outputs(self, levels: list[bool]):
         """Set all digital outputs.
@@ -1168,9 +1502,10 @@ class ScpiClient:
             if levels[i]:
                 mask |= (1 << i)
 
-        res = self.__dll.AbsScpiClient_SetAllDigitalOutputs(
-                self.__handle, c_uint(mask))
-        self.__check_err(res)
+        res = self._AbsScpiClient_SetAllDigitalOutputs(
+                self.__h, mask)
+        if res < 0:
+            raise self.__error(res)
 
     def get_digital_output(self, channel: int) -> bool:
         """Query the state of a single digital output.
@@ -1185,9 +1520,10 @@ class ScpiClient:
             ScpiClientError: An error occurred while executing the query.
         """
         state = c_bool()
-        res = self.__dll.AbsScpiClient_GetDigitalOutput(
-                self.__handle, c_uint(channel), byref(state))
-        self.__check_err(res)
+        res = self._AbsScpiClient_GetDigitalOutput(
+                self.__h, channel, byref(state))
+        if res < 0:
+            raise self.__error(res)
         return state.value
 
     def get_all_digital_outputs(self) -> list[bool]:
@@ -1200,9 +1536,10 @@ class ScpiClient:
             ScpiClientError: An error occurred while executing the query.
         """
         mask = c_uint()
-        res = self.__dll.AbsScpiClient_GetAllDigitalOutputs(
-                self.__handle, byref(mask))
-        self.__check_err(res)
+        res = self._AbsScpiClient_GetAllDigitalOutputs(
+                self.__h, byref(mask))
+        if res < 0:
+            raise self.__error(res)
         m = mask.value
         return [(m & (1 << i)) != 0 for i in range(DIGITAL_OUTPUT_COUNT)]
 
@@ -1219,9 +1556,10 @@ class ScpiClient:
             ScpiClientError: An error occurred while executing the query.
         """
         voltage = c_float()
-        res = self.__dll.AbsScpiClient_MeasureAnalogInput(
-                self.__handle, c_uint(channel), byref(voltage))
-        self.__check_err(res)
+        res = self._AbsScpiClient_MeasureAnalogInput(
+                self.__h, channel, byref(voltage))
+        if res < 0:
+            raise self.__error(res)
         return voltage.value
 
     def measure_all_analog_inputs(self) -> list[float]:
@@ -1234,9 +1572,10 @@ class ScpiClient:
             ScpiClientError: An error occurred while executing the query.
         """
         voltages = (c_float * ANALOG_INPUT_COUNT)()
-        res = self.__dll.AbsScpiClient_MeasureAllAnalogInputs(
-                self.__handle, byref(voltages), c_uint(ANALOG_INPUT_COUNT))
-        self.__check_err(res)
+        res = self._AbsScpiClient_MeasureAllAnalogInputs(
+                self.__h, voltages, ANALOG_INPUT_COUNT)
+        if res < 0:
+            raise self.__error(res)
         return voltages[:]
 
     def measure_digital_input(self, channel: int) -> bool:
@@ -1252,9 +1591,10 @@ class ScpiClient:
             ScpiClientError: An error occurred while executing the query.
         """
         val = c_bool()
-        res = self.__dll.AbsScpiClient_MeasureDigitalInput(
-                self.__handle, c_uint(channel), byref(val))
-        self.__check_err(res)
+        res = self._AbsScpiClient_MeasureDigitalInput(
+                self.__h, channel, byref(val))
+        if res < 0:
+            raise self.__error(res)
         return val.value
 
     def measure_all_digital_inputs(self) -> list[bool]:
@@ -1267,9 +1607,10 @@ class ScpiClient:
             ScpiClientError: An error occurred while executing the query.
         """
         mask = c_uint()
-        res = self.__dll.AbsScpiClient_MeasureAllDigitalInputs(
-                self.__handle, byref(mask))
-        self.__check_err(res)
+        res = self._AbsScpiClient_MeasureAllDigitalInputs(
+                self.__h, byref(mask))
+        if res < 0:
+            raise self.__error(res)
         m = mask.value
         return [(m & (1 << i)) != 0 for i in range(DIGITAL_INPUT_COUNT)]
 
@@ -1283,8 +1624,9 @@ class ScpiClient:
             ScpiClientError: An error occurred while executing the query.
         """
         val = c_uint8()
-        res = self.__dll.AbsScpiClient_GetModelStatus(self.__handle, byref(val))
-        self.__check_err(res)
+        res = self._AbsScpiClient_GetModelStatus(self.__h, byref(val))
+        if res < 0:
+            raise self.__error(res)
         return AbsModelStatus(val.value)
 
     def load_model(self):
@@ -1293,7 +1635,9 @@ class ScpiClient:
         Raises:
             ScpiClientError: An error occurred while sending the command.
         """
-        self.__check_err(self.__dll.AbsScpiClient_LoadModel(self.__handle))
+        res = self._AbsScpiClient_LoadModel(self.__h)
+        if res < 0:
+            raise self.__error(res)
 
     def start_model(self):
         """Start modeling.
@@ -1301,7 +1645,9 @@ class ScpiClient:
         Raises:
             ScpiClientError: An error occurred while sending the command.
         """
-        self.__check_err(self.__dll.AbsScpiClient_StartModel(self.__handle))
+        res = self._AbsScpiClient_StartModel(self.__h)
+        if res < 0:
+            raise self.__error(res)
 
     def stop_model(self):
         """Stop modeling.
@@ -1309,7 +1655,9 @@ class ScpiClient:
         Raises:
             ScpiClientError: An error occurred while sending the command.
         """
-        self.__check_err(self.__dll.AbsScpiClient_StopModel(self.__handle))
+        res = self._AbsScpiClient_StopModel(self.__h)
+        if res < 0:
+            raise self.__error(res)
 
     def unload_model(self):
         """Unload the model configuration.
@@ -1317,7 +1665,9 @@ class ScpiClient:
         Raises:
             ScpiClientError: An error occurred while sending the command.
         """
-        self.__check_err(self.__dll.AbsScpiClient_UnloadModel(self.__handle))
+        res = self._AbsScpiClient_UnloadModel(self.__h)
+        if res < 0:
+            raise self.__error(res)
 
     def get_model_info(self) -> AbsModelInfo:
         """Query information about the model.
@@ -1329,8 +1679,9 @@ class ScpiClient:
             ScpiClientError: An error occurred while executing the query.
         """
         info = AbsModelInfo()
-        res = self.__dll.AbsScpiClient_GetModelInfo(self.__handle, byref(info))
-        self.__check_err(res)
+        res = self._AbsScpiClient_GetModelInfo(self.__h, byref(info))
+        if res < 0:
+            raise self.__error(res)
         return info
 
     def set_global_model_input(self, index: int, value: float):
@@ -1346,9 +1697,10 @@ class ScpiClient:
         Raises:
             ScpiClientError: An error occurred while executing the command.
         """
-        res = self.__dll.AbsScpiClient_SetGlobalModelInput(
-                self.__handle, c_uint(index), c_float(value))
-        self.__check_err(res)
+        res = self._AbsScpiClient_SetGlobalModelInput(
+                self.__h, index, value)
+        if res < 0:
+            raise self.__error(res)
 
     def set_all_global_model_inputs(self, values: list[float]):
         """Set all global model inputs.
@@ -1368,10 +1720,11 @@ class ScpiClient:
         elif len(values) == 0:
             return
 
-        vals = (c_float * len(values))(*values)
-        res = self.__dll.AbsScpiClient_SetAllGlobalModelInputs(
-                self.__handle, byref(vals), c_uint(len(values)))
-        self.__check_err(res)
+        vals = _float_array(values)
+        res = self._AbsScpiClient_SetAllGlobalModelInputs(
+                self.__h, vals, len(values))
+        if res < 0:
+            raise self.__error(res)
 
     def get_global_model_input(self, index: int) -> float:
         """Query a single global model input.
@@ -1386,9 +1739,10 @@ class ScpiClient:
             ScpiClientError: An error occurred while executing the command.
         """
         val = c_float()
-        res = self.__dll.AbsScpiClient_GetGlobalModelInput(
-                self.__handle, c_uint(index), byref(val))
-        self.__check_err(res)
+        res = self._AbsScpiClient_GetGlobalModelInput(
+                self.__h, index, byref(val))
+        if res < 0:
+            raise self.__error(res)
         return val.value
 
     def get_all_global_model_inputs(self) -> list[float]:
@@ -1401,9 +1755,10 @@ class ScpiClient:
             ScpiClientError: An error occurred while executing the command.
         """
         vals = (c_float * GLOBAL_MODEL_INPUT_COUNT)()
-        res = self.__dll.AbsScpiClient_GetAllGlobalModelInputs(
-                self.__handle, byref(vals), c_uint(GLOBAL_MODEL_INPUT_COUNT))
-        self.__check_err(res)
+        res = self._AbsScpiClient_GetAllGlobalModelInputs(
+                self.__h, vals, GLOBAL_MODEL_INPUT_COUNT)
+        if res < 0:
+            raise self.__error(res)
         return vals[:]
 
     def set_local_model_input(self, index: int, value: float):
@@ -1416,9 +1771,10 @@ class ScpiClient:
         Raises:
             ScpiClientError: An error occurred while executing the command.
         """
-        res = self.__dll.AbsScpiClient_SetLocalModelInput(
-                self.__handle, c_uint(index), c_float(value))
-        self.__check_err(res)
+        res = self._AbsScpiClient_SetLocalModelInput(
+                self.__h, index, value)
+        if res < 0:
+            raise self.__error(res)
 
     def set_all_local_model_inputs(self, values: list[float]):
         """Set all local model inputs.
@@ -1435,10 +1791,11 @@ class ScpiClient:
         elif len(values) == 0:
             return
 
-        vals = (c_float * len(values))(*values)
-        res = self.__dll.AbsScpiClient_SetAllLocalModelInputs(
-                self.__handle, byref(vals), c_uint(len(values)))
-        self.__check_err(res)
+        vals = _float_array(values)
+        res = self._AbsScpiClient_SetAllLocalModelInputs(
+                self.__h, vals, len(values))
+        if res < 0:
+            raise self.__error(res)
 
     def get_local_model_input(self, index: int) -> float:
         """Query a single local model input.
@@ -1453,9 +1810,10 @@ class ScpiClient:
             ScpiClientError: An error occurred while executing the command.
         """
         val = c_float()
-        res = self.__dll.AbsScpiClient_GetLocalModelInput(
-                self.__handle, c_uint(index), byref(val))
-        self.__check_err(res)
+        res = self._AbsScpiClient_GetLocalModelInput(
+                self.__h, index, byref(val))
+        if res < 0:
+            raise self.__error(res)
         return val.value
 
     def get_all_local_model_inputs(self) -> list[float]:
@@ -1468,9 +1826,10 @@ class ScpiClient:
             ScpiClientError: An error occurred while executing the command.
         """
         vals = (c_float * LOCAL_MODEL_INPUT_COUNT)()
-        res = self.__dll.AbsScpiClient_GetAllLocalModelInputs(
-                self.__handle, byref(vals), c_uint(LOCAL_MODEL_INPUT_COUNT))
-        self.__check_err(res)
+        res = self._AbsScpiClient_GetAllLocalModelInputs(
+                self.__h, vals, LOCAL_MODEL_INPUT_COUNT)
+        if res < 0:
+            raise self.__error(res)
         return vals[:]
 
     def get_model_output(self, index: int) -> float:
@@ -1486,9 +1845,10 @@ class ScpiClient:
             ScpiClientError: An error occurred while executing the query.
         """
         val = c_float()
-        res = self.__dll.AbsScpiClient_GetModelOutput(
-                self.__handle, c_uint(index), byref(val))
-        self.__check_err(res)
+        res = self._AbsScpiClient_GetModelOutput(
+                self.__h, index, byref(val))
+        if res < 0:
+            raise self.__error(res)
         return val.value
 
     def get_all_model_outputs(self) -> list[float]:
@@ -1501,19 +1861,21 @@ class ScpiClient:
             ScpiClientError: An error occurred while executing the query.
         """
         values = (c_float * MODEL_OUTPUT_COUNT)()
-        res = self.__dll.AbsScpiClient_GetAllModelOutputs(
-                self.__handle, byref(values), c_uint(MODEL_OUTPUT_COUNT))
-        self.__check_err(res)
+        res = self._AbsScpiClient_GetAllModelOutputs(
+                self.__h, values, MODEL_OUTPUT_COUNT)
+        if res < 0:
+            raise self.__error(res)
         return values[:]
 
     def multicast_discovery(
         self,
-        interface_ip: str,
+        interface_ip: str | bytes,
     ) -> list[AbsEthernetDiscoveryResult]:
         """Use UDP multicast to discover ABSes on the network.
 
         This function does not require the ScpiClient to be initialized or
-        connected.
+        connected. Other Python threads continue to run while it waits for
+        responses.
 
         Args:
             interface_ip: IP address of the local NIC to bind to.
@@ -1526,14 +1888,15 @@ class ScpiClient:
         """
         results = (AbsEthernetDiscoveryResult * 64)()
         count = c_uint(len(results))
-        res = self.__dll.AbsScpiClient_MulticastDiscovery(
-                interface_ip.encode(), byref(results), byref(count))
-        self.__check_err(res)
+        res = self._AbsScpiClient_MulticastDiscovery(
+                _encode(interface_ip), results, byref(count))
+        if res < 0:
+            raise self.__error(res)
         return results[:count.value]
 
     def serial_discovery(
         self,
-        port: str,
+        port: str | bytes,
         first_id: int = 0,
         last_id: int = 31,
     ) -> list[AbsSerialDiscoveryResult]:
@@ -1561,8 +1924,9 @@ class ScpiClient:
 
         count = c_uint(last_id - first_id + 1)
         results = (AbsSerialDiscoveryResult * count.value)()
-        res = self.__dll.AbsScpiClient_SerialDiscovery(
-                port.encode(), c_uint8(first_id), c_uint8(last_id),
-                byref(results), byref(count))
-        self.__check_err(res)
+        res = self._AbsScpiClient_SerialDiscovery(
+                _encode(port), first_id, last_id,
+                results, byref(count))
+        if res < 0:
+            raise self.__error(res)
         return results[:count.value]
@@ -11,6 +11,8 @@ import sys
 
 sys.path.insert(0, os.path.abspath('..'))
 
+# Importing absscpi doesn't load the native library (that only happens when a
+# ScpiClient is created), so the docs can be built without it installed.
 import absscpi
 
 project = 'absscpi'